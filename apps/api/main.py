@@ -1,17 +1,27 @@
 import os
-import json
+import asyncio
+import re
 import time
-import uuid
+import heapq
+import hashlib
 import pathlib
+import tempfile
+import multiprocessing
 import datetime as dt
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from collections import OrderedDict
 from typing import List, Optional
 
 import httpx
-import ics
-from fastapi import FastAPI, UploadFile, File
+import msgspec
+import orjson
+from icalendar import Calendar
+from icalendar.prop import vDDDTypes
+from fastapi import FastAPI, UploadFile, File, Request, Response, Depends, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
-from pydantic import BaseModel
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, ORJSONResponse
 from openai import OpenAI
 
 # ----------- Config (env overrides allowed) -----------
@@ -23,21 +33,72 @@ UTA_AVG_COST = os.getenv("UTA_AVG_COST", "https://www.uta.edu/administration/fao
 DATA_DIR = pathlib.Path("data"); DATA_DIR.mkdir(exist_ok=True)
 ICS_DIR = DATA_DIR / "ics"; ICS_DIR.mkdir(exist_ok=True)
 
-# Simple cache for events
-EVENTS_CACHE = {"data": None, "ts": 0.0}
+# Simple cache for events (validators let us revalidate with a conditional GET)
+# "candidates" holds every not-yet-started event as (begin_utc, event dict); the
+# upcoming window is cut from it on each read so it never goes stale on a 304.
+EVENTS_CACHE = {"candidates": None, "ts": 0.0, "etag": None, "last_modified": None}
 EVENTS_TTL = 300  # 5 minutes
+EVENTS_CACHE_CONTROL = f"public, max-age=60, stale-while-revalidate={EVENTS_TTL}"
+EVENTS_INFLIGHT: Optional[asyncio.Task] = None  # single in-flight refresh
+
+# Byte-level scanners so we only fully parse VEVENTs that can still be upcoming
+VEVENT_RE = re.compile(rb"BEGIN:VEVENT.*?END:VEVENT", re.S)
+DTSTART_RE = re.compile(rb"^DTSTART[^:\r\n]*:([^\r\n]+)", re.M)
+
+# Single-event calendar written by /calendar/create (RFC 5545, CRLF line endings)
+ICS_TMPL = (
+    "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//UTA Copilot//EN\r\n"
+    "BEGIN:VEVENT\r\nUID:{uid}\r\nDTSTAMP:{dtstamp}\r\nDTSTART:{dtstart}\r\nDTEND:{dtend}\r\n"
+    "SUMMARY:{title}\r\n{loc}END:VEVENT\r\nEND:VCALENDAR\r\n"
+)
+ICS_ESCAPE = str.maketrans({"\\": "\\\\", ";": "\\;", ",": "\\,", "\n": "\\n", "\r": ""})
+
+# Intent keywords, matched as substrings in a single pass over the message
+INTENT_RE = re.compile(r"event|happening|dining|menu|tuition|cost")
+
+# Small LRU of /chat answers keyed by normalized message text
+CHAT_CACHE: "OrderedDict[str, tuple]" = OrderedDict()
+CHAT_CACHE_SIZE = 1024
+CHAT_TTL = min(60, EVENTS_TTL)
+PUNCT_RE = re.compile(r"[^\w\s]+")
+
+# /stt keeps uploads up to this size in memory
+STT_MEMORY_MAX = 8 << 20
 
 # ----------- Models -----------
-class ChatMessage(BaseModel):
+class ChatMessage(msgspec.Struct):
     role: str
     content: str
 
-class ChatRequest(BaseModel):
+class ChatRequest(msgspec.Struct):
     messages: List[ChatMessage]
     user_profile: Optional[dict] = None
 
+CHAT_DECODER = msgspec.json.Decoder(ChatRequest)
+# The body bypasses FastAPI's model handling, so describe it in OpenAPI by hand
+_, CHAT_SCHEMAS = msgspec.json.schema_components([ChatRequest], ref_template="#/components/schemas/{name}")
+CHAT_OPENAPI = {"requestBody": {
+    "required": True,
+    "content": {"application/json": {"schema": {"$ref": "#/components/schemas/ChatRequest"}}},
+}}
+
+async def chat_request(request: Request) -> ChatRequest:
+    # Decode + validate the body in one pass instead of going through pydantic
+    try:
+        return CHAT_DECODER.decode(await request.body())
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
 # ----------- App -----------
-app = FastAPI(title="UTA Copilot API")
+app = FastAPI(title="UTA Copilot API", default_response_class=ORJSONResponse)
+
+def _openapi():
+    if not app.openapi_schema:
+        schema = FastAPI.openapi(app)
+        schema.setdefault("components", {}).setdefault("schemas", {}).update(CHAT_SCHEMAS)
+    return app.openapi_schema
+
+app.openapi = _openapi
 
 # CORS for dev; tighten later
 app.add_middleware(
@@ -47,48 +108,162 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Compress larger JSON payloads (events lists) for mobile clients
+app.add_middleware(GZipMiddleware, minimum_size=512)
 
 # Shared HTTP client (keep-alive + timeout)
 @app.on_event("startup")
 async def _startup():
-    # remove http2=True
-    app.state.http = httpx.AsyncClient(timeout=12)
+    app.state.http = httpx.AsyncClient(
+        timeout=12,
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30),
+    )
+    app.state.http_loop = asyncio.get_running_loop()
+    app.state.parse_pool = _new_parse_pool()
+    # Shared OpenAI client so /stt reuses its connection pool
+    api_key = os.getenv("OPENAI_API_KEY")
+    app.state.openai = OpenAI(api_key=api_key) if api_key else None
+    # The refresher's first fetch runs in the background and also warms TCP+TLS
+    # to the events host, so startup never waits on the network
+    app.state.events_refresher = asyncio.create_task(_refresh_events_loop())
 
 
 @app.on_event("shutdown")
 async def _shutdown():
+    app.state.events_refresher.cancel()
+    app.state.parse_pool.shutdown(wait=False, cancel_futures=True)
     try:
         await app.state.http.aclose()
     except Exception:
         pass
+    try:
+        if app.state.openai:
+            app.state.openai.close()
+    except Exception:
+        pass
 
 # ----------- Helpers -----------
+def _new_parse_pool() -> ProcessPoolExecutor:
+    # Feed parsing is GIL-bound, so it runs in a worker process. Refreshes are
+    # single-flight, so one worker is all that can ever be busy. "spawn" avoids
+    # forking a running server that already has threads.
+    return ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+
+async def _http_get(url: str, **kwargs) -> httpx.Response:
+    # Pooled connections are bound to the loop that opened them, so a caller on
+    # another loop uses a short-lived client that is closed straight away
+    if asyncio.get_running_loop() is getattr(app.state, "http_loop", None):
+        return await app.state.http.get(url, **kwargs)
+    async with httpx.AsyncClient(timeout=12) as client:
+        return await client.get(url, **kwargs)
+
+def _as_utc(value) -> dt.datetime:
+    # DATE values start at midnight; floating/naive times are treated as UTC
+    if not isinstance(value, dt.datetime):
+        return dt.datetime.combine(value, dt.time.min, tzinfo=dt.timezone.utc)
+    if value.tzinfo is None:
+        return value.replace(tzinfo=dt.timezone.utc)
+    return value
+
+def _parse_events(content: bytes) -> list:
+    now_dt = dt.datetime.now(dt.timezone.utc)
+    # TZID-qualified starts are read as UTC by the prefilter, so allow a day of slack
+    cutoff = now_dt - dt.timedelta(days=1)
+    candidates = []
+    for m in VEVENT_RE.finditer(content):
+        chunk = m.group(0)
+        start = DTSTART_RE.search(chunk)
+        if start:
+            try:
+                if _as_utc(vDDDTypes.from_ical(start.group(1).decode().strip())) < cutoff:
+                    continue
+            except Exception:
+                pass  # let the full parse decide
+        try:
+            cal = Calendar.from_ical(b"BEGIN:VCALENDAR\r\n" + chunk + b"\r\nEND:VCALENDAR\r\n")
+        except Exception:
+            continue
+        for ev in cal.walk("VEVENT"):
+            if "DTSTART" not in ev:
+                continue
+            begin = ev.decoded("DTSTART")
+            begin_utc = _as_utc(begin)  # normalized once, reused as the heap key
+            if begin_utc >= now_dt:
+                title, location = ev.get("SUMMARY"), ev.get("LOCATION")
+                candidates.append((begin_utc, {
+                    "title": str(title) if title else None,
+                    "begin": begin.strftime("%Y-%m-%d %H:%M"),
+                    "location": str(location) if location else None,
+                }))
+    return candidates
+
+def _upcoming_events(candidates: list, limit: int) -> list:
+    now_dt = dt.datetime.now(dt.timezone.utc)
+    future = (c for c in candidates if c[0] >= now_dt)
+    return [ev for _, ev in heapq.nsmallest(limit, future, key=lambda c: c[0])]
+
 async def fetch_events(ical_url: Optional[str] = None, limit: int = 10):
     now = time.time()
-    if EVENTS_CACHE["data"] and now - EVENTS_CACHE["ts"] < EVENTS_TTL:
-        return EVENTS_CACHE["data"]
+    candidates = EVENTS_CACHE["candidates"]
+    if candidates is not None:
+        if now - EVENTS_CACHE["ts"] >= EVENTS_TTL:
+            # stale-while-revalidate: serve what we have, refresh in the background
+            _start_events_refresh(ical_url)
+    else:
+        # Cold cache: every caller waits on the same fetch
+        candidates = await asyncio.shield(_start_events_refresh(ical_url))
+    return {"events": _upcoming_events(candidates, limit)}
 
+def _start_events_refresh(ical_url: Optional[str] = None) -> asyncio.Task:
+    global EVENTS_INFLIGHT
+    if EVENTS_INFLIGHT is None or EVENTS_INFLIGHT.done():
+        EVENTS_INFLIGHT = asyncio.create_task(_refresh_events(ical_url))
+        # background refreshes may have no awaiter; don't warn about their errors
+        EVENTS_INFLIGHT.add_done_callback(lambda t: t.cancelled() or t.exception())
+    return EVENTS_INFLIGHT
+
+async def _refresh_events(ical_url: Optional[str] = None) -> list:
     src = ical_url or UTA_EVENTS_ICS
-    r = await app.state.http.get(src)
+    headers = {}
+    if EVENTS_CACHE["candidates"] is not None:
+        if EVENTS_CACHE["etag"]:
+            headers["If-None-Match"] = EVENTS_CACHE["etag"]
+        if EVENTS_CACHE["last_modified"]:
+            headers["If-Modified-Since"] = EVENTS_CACHE["last_modified"]
+    r = await _http_get(src, headers=headers)
+    if r.status_code == 304:
+        # Feed unchanged: skip the parse and keep the parsed candidates
+        EVENTS_CACHE["ts"] = time.time()
+        return EVENTS_CACHE["candidates"]
     r.raise_for_status()
 
-    cal = ics.Calendar(r.text)
-    upcoming = []
-    now_dt = dt.datetime.now(dt.timezone.utc)
-    for ev in sorted(cal.events, key=lambda e: e.begin or now_dt):
-        begin_dt = ev.begin.datetime if ev.begin else None
-        if begin_dt and begin_dt >= now_dt:
-            upcoming.append({
-                "title": ev.name,
-                "begin": ev.begin.format("YYYY-MM-DD HH:mm"),
-                "location": ev.location,
-            })
-            if len(upcoming) >= limit:
-                break
-
-    data = {"events": upcoming}
-    EVENTS_CACHE.update({"data": data, "ts": time.time()})
-    return data
+    # Parsing is pure-Python CPU work; keep it off the event loop and out of this
+    # process's GIL. _parse_events returns plain tuples/dicts, so the result pickles.
+    loop = asyncio.get_running_loop()
+    try:
+        candidates = await loop.run_in_executor(app.state.parse_pool, _parse_events, r.content)
+    except BrokenProcessPool:
+        # A dead worker breaks the pool for good: replace it and parse in a thread
+        app.state.parse_pool.shutdown(wait=False, cancel_futures=True)
+        app.state.parse_pool = _new_parse_pool()
+        candidates = await asyncio.to_thread(_parse_events, r.content)
+    EVENTS_CACHE.update({
+        "candidates": candidates,
+        "ts": time.time(),
+        "etag": r.headers.get("ETag"),
+        "last_modified": r.headers.get("Last-Modified"),
+    })
+    return candidates
+
+async def _refresh_events_loop():
+    # Re-fetch shortly before the TTL runs out so no /chat request hits a cold cache
+    while True:
+        try:
+            await _start_events_refresh()
+        except Exception:
+            pass
+        await asyncio.sleep(EVENTS_TTL - 30)
 
 async def fetch_dining_today(base: str = None):
     # Stub response for MVP; replace with real scrape/API later
@@ -103,80 +278,189 @@ async def fetch_dining_today(base: str = None):
 
 async def fetch_average_cost(url: str = None):
     target = url or UTA_AVG_COST
-    r = await app.state.http.get(target)
+    r = await _http_get(target)
     r.raise_for_status()
     return {"source": target, "html_length": len(r.text)}
 
-def build_ics(title: str, begin_iso: str, end_iso: str, location: str = None) -> pathlib.Path:
-    c = ics.Calendar()
-    e = ics.Event()
-    e.name = title
-    e.begin = begin_iso
-    e.end = end_iso
-    if location:
-        e.location = location
-    c.events.add(e)
-    file_id = uuid.uuid4().hex
-    out = ICS_DIR / f"{file_id}.ics"
-    out.write_text(str(c), encoding="utf-8")
+def _ics_utc(iso: str) -> str:
+    # Naive times are taken as UTC
+    value = dt.datetime.fromisoformat(iso.replace("Z", "+00:00"))
+    return _as_utc(value).astimezone(dt.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+async def build_ics(title: str, begin_iso: str, end_iso: str, location: str = None) -> pathlib.Path:
+    # Output is a pure function of the inputs, so name the file by content and
+    # reuse it when the same event is submitted again
+    # JSON keeps fields unambiguous (None vs "None", "|" inside a value)
+    key = hashlib.blake2b(orjson.dumps([title, begin_iso, end_iso, location]), digest_size=8).hexdigest()
+    out = ICS_DIR / f"{key}.ics"
+    if await asyncio.to_thread(out.exists):
+        return out
+
+    rendered = ICS_TMPL.format(
+        uid=f"{key}@uta-copilot",
+        dtstamp=dt.datetime.now(dt.timezone.utc).strftime("%Y%m%dT%H%M%SZ"),
+        dtstart=_ics_utc(begin_iso),
+        dtend=_ics_utc(end_iso),
+        title=title.translate(ICS_ESCAPE),
+        loc=f"LOCATION:{location.translate(ICS_ESCAPE)}\r\n" if location else "",
+    )
+    # keep disk latency off the event loop
+    await asyncio.to_thread(_write_atomic, out, rendered.encode("utf-8"))
     return out
 
+def _write_atomic(path: pathlib.Path, data: bytes):
+    # Concurrent identical creates may both write; renaming a complete temp file
+    # into place means a reader never sees a half-written calendar
+    with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as tmp:
+        tmp.write(data)
+    os.replace(tmp.name, path)
+
+def _ics_stat(fname: str):
+    # One stat per download, reused by FileResponse instead of it stat-ing again.
+    # Not memoized: files can be deleted or replaced between downloads.
+    p = ICS_DIR / fname
+    return p, p.stat()
+
 # ----------- Routes -----------
+# Probe endpoint: rebuild the JSON body at most once per second
+_HEALTH = [0, b""]
+
 @app.get("/health")
 async def health():
-    return {"ok": True, "ts": dt.datetime.utcnow().isoformat()}
+    s = int(time.time())
+    if s != _HEALTH[0]:
+        ts = dt.datetime.fromtimestamp(s, dt.timezone.utc).replace(tzinfo=None).isoformat()
+        _HEALTH[0], _HEALTH[1] = s, orjson.dumps({"ok": True, "ts": ts})
+    return Response(content=_HEALTH[1], media_type="application/json")
+
+# safe fallback so UI never goes blank; compared by identity to keep it out of caches
+EVENTS_FALLBACK = {"events":[{"title":"Test Event","begin":"2025-09-05 18:00","location":"University Center"}]}
 
-@app.post("/chat")
-async def chat(req: ChatRequest):
+async def _events_intent():
+    try:
+        data = await fetch_events()
+    except Exception:
+        data = EVENTS_FALLBACK
+    return {"name": "events", "content": data}
+
+def _is_fallback(resp: dict) -> bool:
+    parts = resp["content"] if resp["name"] == "multi" else [resp]
+    return any(p["content"] is EVENTS_FALLBACK for p in parts)
+
+async def _dining_intent():
+    return {"name": "dining", "content": await fetch_dining_today()}
+
+async def _avg_cost_intent():
+    return {"name": "avg_cost", "content": await fetch_average_cost()}
+
+INTENT_HANDLERS = {
+    "event": _events_intent,
+    "happening": _events_intent,
+    "dining": _dining_intent,
+    "menu": _dining_intent,
+    "tuition": _avg_cost_intent,
+    "cost": _avg_cost_intent,
+}
+INTENT_ORDER = list(dict.fromkeys(INTENT_HANDLERS.values()))
+
+def _match_intents(key: str):
+    # One scan of the normalized message (words separated by single spaces).
+    # Returns (all hits, whole-word hits); only whole words, optionally plural, can
+    # fan out to several intents, so "costume" doesn't turn an answer into "multi".
+    matched, words = set(), set()
+    for m in INTENT_RE.finditer(key):
+        fn = INTENT_HANDLERS[m.group(0)]
+        matched.add(fn)
+        start, end = m.span()
+        if key.startswith("s", end):
+            end += 1
+        if (start == 0 or key[start - 1] == " ") and (end == len(key) or key[end] == " "):
+            words.add(fn)
+    return matched, words
+
+@app.post("/chat", openapi_extra=CHAT_OPENAPI)
+async def chat(response: Response, req: ChatRequest = Depends(chat_request)):
     last = (req.messages[-1].content if req.messages else "").lower()
+    # lowercase, drop punctuation, collapse whitespace
+    key = " ".join(PUNCT_RE.sub(" ", last).split())
 
     try:
-        if "event" in last or "happening" in last:
-            try:
-                data = await fetch_events()
-            except Exception:
-                # safe fallback so UI never goes blank
-                data = {"events":[{"title":"Test Event","begin":"2025-09-05 18:00","location":"University Center"}]}
-            return {"name": "events", "content": data}
+        hit = CHAT_CACHE.get(key)
+        if hit and time.monotonic() - hit[0] < CHAT_TTL:
+            CHAT_CACHE.move_to_end(key)
+            resp = hit[1]
+        else:
+            matched, words = _match_intents(key)
+            if len(words) > 1:
+                intents = [fn for fn in INTENT_ORDER if fn in words]
+            else:
+                # first match wins, as before multi-intent support
+                intents = [fn for fn in INTENT_ORDER if fn in matched][:1]
 
-        if "dining" in last or "menu" in last:
-            data = await fetch_dining_today()
-            return {"name": "dining", "content": data}
+            if not intents:
+                return {"name": "answer", "content": "RAG answer placeholder. Try asking about events, dining, or cost."}
+            if len(intents) == 1:
+                resp = await intents[0]()
+            else:
+                # Several topics in one message: fetch them concurrently and drop
+                # the ones that failed rather than failing the whole answer
+                results = await asyncio.gather(*(fn() for fn in intents), return_exceptions=True)
+                parts = [r for r in results if not isinstance(r, BaseException)]
+                if not parts:
+                    raise results[0]
+                resp = parts[0] if len(parts) == 1 else {"name": "multi", "content": parts}
 
-        if "tuition" in last or "average cost" in last or "cost" in last:
-            data = await fetch_average_cost()
-            return {"name": "avg_cost", "content": data}
+            if not _is_fallback(resp):
+                CHAT_CACHE[key] = (time.monotonic(), resp)
+                CHAT_CACHE.move_to_end(key)
+                if len(CHAT_CACHE) > CHAT_CACHE_SIZE:
+                    CHAT_CACHE.popitem(last=False)
 
-        return {"name": "answer", "content": "RAG answer placeholder. Try asking about events, dining, or cost."}
+        # Only real events are advertised as cacheable. Note /chat is a POST, so
+        # shared/browser caches won't store it; this mainly informs app-level caches.
+        if resp["name"] == "events" and not _is_fallback(resp):
+            response.headers["Cache-Control"] = EVENTS_CACHE_CONTROL
+        return resp
     except Exception as e:
-        return JSONResponse({"error": f"chat_failed: {e}"}, status_code=500)
+        return ORJSONResponse({"error": f"chat_failed: {e}"}, status_code=500)
 
 # Speech-to-Text (Whisper)
 @app.post("/stt")
 async def stt(file: UploadFile = File(...)):
     try:
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            return JSONResponse({"error":"OPENAI_API_KEY not set"}, status_code=500)
+        client = getattr(app.state, "openai", None)
+        if not client:
+            return ORJSONResponse({"error":"OPENAI_API_KEY not set"}, status_code=500)
 
-        # Save uploaded file with a sensible name/extension
+        # Buffer the upload in memory, spilling to a temp file only past STT_MEMORY_MAX,
+        # and hand it to Whisper with a sensible name/extension
         fname = file.filename or "audio.m4a"
-        tmp = DATA_DIR / f"upload_{uuid.uuid4().hex}_{fname}"
-        tmp.write_bytes(await file.read())
-
+        buf, disk = bytearray(), None
         try:
-            client = OpenAI(api_key=api_key)
-            with tmp.open("rb") as f:
-                tr = client.audio.transcriptions.create(model="whisper-1", file=f)
-            text = getattr(tr, "text", None) or str(tr)
-            return {"text": text}
+            while chunk := await file.read(1 << 20):
+                if disk is None and len(buf) + len(chunk) > STT_MEMORY_MAX:
+                    disk = tempfile.TemporaryFile()
+                    disk.write(buf)
+                    buf = bytearray()
+                if disk is None:
+                    buf += chunk
+                else:
+                    disk.write(chunk)
+            if disk is not None:
+                disk.seek(0)
+            tr = client.audio.transcriptions.create(
+                model="whisper-1",
+                file=(fname, disk if disk is not None else bytes(buf), file.content_type or "audio/m4a"),
+            )
         finally:
-            try: tmp.unlink()
-            except: pass
+            if disk is not None:
+                disk.close()
+        text = getattr(tr, "text", None) or str(tr)
+        return {"text": text}
 
     except Exception as e:
         # Always return JSON so the app can parse errors safely
-        return JSONResponse({"error": f"stt_failed: {e}"}, status_code=400)
+        return ORJSONResponse({"error": f"stt_failed: {e}"}, status_code=400)
 
 # Calendar create + download
 @app.post("/calendar/create")
@@ -187,15 +471,16 @@ async def calendar_create(payload: dict):
         end = payload.get("end")
         location = payload.get("location")
         if not title or not begin or not end:
-            return JSONResponse({"error":"title, begin, end are required"}, status_code=400)
-        ics_path = build_ics(title, begin, end, location)
+            return ORJSONResponse({"error":"title, begin, end are required"}, status_code=400)
+        ics_path = await build_ics(title, begin, end, location)
         return {"url": f"/calendar/{ics_path.name}", "filename": ics_path.name}
     except Exception as e:
-        return JSONResponse({"error": str(e)}, status_code=400)
+        return ORJSONResponse({"error": str(e)}, status_code=400)
 
 @app.get("/calendar/{fname}")
 async def calendar_download(fname: str):
-    f = ICS_DIR / fname
-    if not f.exists():
-        return JSONResponse({"error":"not found"}, status_code=404)
-    return FileResponse(path=f, media_type="text/calendar", filename=fname)
+    try:
+        f, st = await asyncio.to_thread(_ics_stat, fname)
+    except FileNotFoundError:
+        return ORJSONResponse({"error":"not found"}, status_code=404)
+    return FileResponse(path=f, stat_result=st, media_type="text/calendar", filename=fname)